@@ -0,0 +1,48 @@
+"""Compare bytes on the wire and time for native vs raster QR codes and barcodes.
+
+Run from the repository root:
+    python -m benchmarks.bench_codes
+"""
+import contextlib
+import io
+import time
+from escpos.printer import Dummy
+from components.qr_code import encode_qr_raster, print_qr_code, render_qr_code
+from components.order_barcode import encode_barcode_raster, print_barcode, render_barcode
+
+RUNS = 200
+# Sample Lao QR (EMVCo style) payment payload
+QR_PAYLOAD = (
+    "00020101021138670016A00526628466257701082771041802030010324"
+    "P2GSHOP0000000000000001530341854061250.005802LA5908P2G Shop6009Vientiane6304ABCD"
+)
+ORDER_NUMBER = "A0001-20250315"
+
+def measure(label, job):
+    printer = Dummy()
+    # python-escpos prints notices on every image/barcode; keep the table readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        job(printer)
+        size = len(printer.output)
+
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            printer.clear()
+            job(printer)
+        elapsed = (time.perf_counter() - start) / RUNS
+    print(f"{label:<28} {size:>8} bytes {elapsed * 1e6:>10.1f} us/print")
+
+def clear_caches():
+    for func in (render_qr_code, encode_qr_raster, render_barcode, encode_barcode_raster):
+        func.cache_clear()
+
+def main():
+    measure("QR native (GS ( k)", lambda p: print_qr_code(p, QR_PAYLOAD, native=True))
+    measure("QR raster (uncached)", lambda p: (clear_caches(), print_qr_code(p, QR_PAYLOAD, native=False)))
+    measure("QR raster (cached)", lambda p: print_qr_code(p, QR_PAYLOAD, native=False))
+    measure("Barcode native (GS k)", lambda p: print_barcode(p, ORDER_NUMBER, native=True))
+    measure("Barcode raster (uncached)", lambda p: (clear_caches(), print_barcode(p, ORDER_NUMBER, native=False)))
+    measure("Barcode raster (cached)", lambda p: print_barcode(p, ORDER_NUMBER, native=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Compare file size and truetype load time of the full and subsetted receipt fonts.
+
+Prepare the subsets first, then run from the repository root:
+    python prepare_fonts.py
+    python -m benchmarks.bench_font_subset
+"""
+import os
+import time
+from PIL import ImageFont
+from contants import FONT_CACHE
+from utils.font_subset import load_manifest
+
+RUNS = 200
+FONT_SIZES = (16, 18, 20, 22, 24, 26, 36)
+
+def measure(label, font_path):
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        for size in FONT_SIZES:
+            ImageFont.truetype(font_path, size)
+    elapsed = (time.perf_counter() - start) / RUNS
+    size = os.path.getsize(font_path)
+    print(f"{label:<28} {size:>8} bytes {elapsed * 1e6:>10.1f} us/load ({len(FONT_SIZES)} sizes)")
+
+def main():
+    manifest = load_manifest()
+    if not manifest:
+        print("No subsets prepared, run: python prepare_fonts.py")
+        return
+    for font_name, entry in manifest.items():
+        measure(f"{font_name} full", os.path.join(FONT_CACHE, entry["source"]))
+        measure(f"{font_name} subset", os.path.join(FONT_CACHE, entry["subset"]))
+
+if __name__ == "__main__":
+    main()
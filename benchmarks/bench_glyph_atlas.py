@@ -0,0 +1,66 @@
+"""Compare numeric column rendering: FreeType draw.text vs the glyph atlas.
+
+Run from the repository root:
+    python -m benchmarks.bench_glyph_atlas
+"""
+import os
+import random
+import time
+from PIL import Image, ImageDraw, ImageFont
+from contants import FONT_CACHE, PRINTER_WIDTH
+from utils.glyph_atlas import get_glyph_atlas
+
+ROWS = 2000
+COLUMNS = ((280, "{:>4}"), (380, "{:>6.2f}"), (480, "{:>7.2f}"))
+
+def load_font(font_size):
+    font_path = os.path.join(FONT_CACHE, "NotoSansLao.ttf")
+    try:
+        return ImageFont.truetype(font_path, font_size)
+    except OSError:
+        return ImageFont.load_default(font_size)
+
+def sample_rows(count):
+    random.seed(0)
+    rows = []
+    for _ in range(count):
+        qty = random.randint(1, 20)
+        price = random.uniform(0, 500)
+        rows.append((qty, price, qty * price))
+    return rows
+
+def render_rows(rows, font, use_atlas):
+    atlas = get_glyph_atlas(font)
+    images = []
+    for row in rows:
+        img = Image.new("1", (PRINTER_WIDTH, int(font.size * 1.8)), 1)
+        draw = ImageDraw.Draw(img)
+        for (x, fmt), value in zip(COLUMNS, row):
+            if use_atlas:
+                atlas.draw(img, (x, 2), fmt.format(value))
+            else:
+                draw.text((x, 2), fmt.format(value), font=font, fill=0)
+        images.append(img)
+    return images
+
+def main():
+    rows = sample_rows(ROWS)
+    print(f"{'size':>4} {'draw.text us/row':>17} {'atlas us/row':>13} {'speedup':>8} {'identical':>9}")
+    for font_size in (16, 18, 22, 24, 36):
+        font = load_font(font_size)
+        get_glyph_atlas(font)  # Build once, outside the timed loop
+
+        start = time.perf_counter()
+        expected = render_rows(rows, font, use_atlas=False)
+        freetype_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = render_rows(rows, font, use_atlas=True)
+        atlas_time = time.perf_counter() - start
+
+        identical = all(a.tobytes() == b.tobytes() for a, b in zip(expected, actual))
+        print(f"{font_size:>4} {freetype_time / ROWS * 1e6:>17.1f} {atlas_time / ROWS * 1e6:>13.1f} "
+              f"{freetype_time / atlas_time:>7.2f}x {str(identical):>9}")
+
+if __name__ == "__main__":
+    main()
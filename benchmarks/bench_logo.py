@@ -0,0 +1,51 @@
+"""Compare printing a logo through printer.image with the prepared, cached raster bytes.
+
+Run from the repository root:
+    python -m benchmarks.bench_logo
+"""
+import contextlib
+import io
+import os
+import tempfile
+import time
+from PIL import Image, ImageDraw
+from escpos.printer import Dummy
+from components.logo import _logo_bytes, print_logo, render_logo
+
+RUNS = 50
+
+def make_logo(path):
+    """Draw a transparent RGBA logo wider than the paper, like a typical PNG shop logo"""
+    img = Image.new("RGBA", (1200, 500), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw.ellipse((100, 50, 1100, 450), fill=(200, 30, 30, 255))
+    draw.rectangle((350, 180, 850, 320), fill=(20, 20, 20, 255))
+    img.save(path)
+
+def measure(label, job):
+    printer = Dummy()
+    # python-escpos prints notices on every image; keep the table readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        job(printer)
+        size = len(printer.output)
+
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            printer.clear()
+            job(printer)
+        elapsed = (time.perf_counter() - start) / RUNS
+    print(f"{label:<28} {size:>8} bytes {elapsed * 1e6:>10.1f} us/print")
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        logo_path = os.path.join(tmp, "logo.png")
+        cache_dir = os.path.join(tmp, "logo_cache")
+        make_logo(logo_path)
+
+        measure("printer.image (per print)", lambda p: p.image(render_logo(logo_path)))
+        measure("prepared (memory only)", lambda p: (_logo_bytes.clear(), print_logo(p, logo_path, cache_dir=None)))
+        measure("prepared (disk cache)", lambda p: (_logo_bytes.clear(), print_logo(p, logo_path, cache_dir=cache_dir)))
+        measure("prepared (cached bytes)", lambda p: print_logo(p, logo_path, cache_dir=cache_dir))
+
+if __name__ == "__main__":
+    main()
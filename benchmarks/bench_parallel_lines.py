@@ -0,0 +1,48 @@
+"""Latency of rendering one large receipt's lines with different worker counts.
+
+Workers are processes and are capped at the CPU count, so on a single-core
+machine every row measures the serial path.
+
+Run from the repository root:
+    python -m benchmarks.bench_parallel_lines
+"""
+import contextlib
+import io
+import os
+import statistics
+import time
+from utils.receipt import render_lines
+from components import render_item_line, render_receipt_line, render_total_line
+
+ITEMS = 300
+RUNS = 30
+WORKER_COUNTS = (1, 2, 4, 8)
+
+def build_jobs():
+    names = ["ເບຍລາວ", "ນົມສົດ", "ໄຂ່ໄກ່ (12 ໜ່ວຍ)", "ກາເຟ", "Coffee", "Bread"]
+    jobs = [(render_receipt_line, ("-" * 80,), {"font_size": 26})]
+    for i in range(ITEMS):
+        qty, price = i % 7 + 1, 1.25 * (i % 40)
+        jobs.append((render_item_line, (names[i % len(names)], qty, price, qty * price), {"font_size": 22}))
+    jobs.append((render_total_line, ("TOTAL:", 12345.67), {"font_size": 24}))
+    return jobs
+
+def main():
+    jobs = build_jobs()
+    print(f"{len(jobs)} lines per receipt, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'p50 ms':>8} {'p99 ms':>8}")
+    # download_direct_font reports cache hits on stdout for every line
+    for workers in WORKER_COUNTS:
+        timings = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            render_lines(jobs, workers=workers)  # Warm up fonts and atlases
+            for _ in range(RUNS):
+                start = time.perf_counter()
+                render_lines(jobs, workers=workers)
+                timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        print(f"{workers:>7} {statistics.median(timings):>8.1f} {p99:>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,19 @@ from .receipt_line import render_receipt_line
 from .item_line import render_item_line
 from .table_header import render_table_header
 from .total_line import render_total_line
+from .qr_code import render_qr_code, print_qr_code
+from .order_barcode import render_barcode, print_barcode
+from .logo import render_logo, print_logo
 
 __all__ = [
     'render_receipt_line',
     'render_item_line', 
     'render_table_header',
-    'render_total_line'
+    'render_total_line',
+    'render_qr_code',
+    'print_qr_code',
+    'render_barcode',
+    'print_barcode',
+    'render_logo',
+    'print_logo'
 ]
\ No newline at end of file
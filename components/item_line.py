@@ -2,8 +2,9 @@ from PIL import Image, ImageDraw, ImageFont
 import os
 import textwrap
 import unicodedata
-from utils.fonts import download_direct_font, get_system_font_fallback
+from utils.fonts import download_direct_font, get_system_font_fallback, get_truetype_font
 from utils.helpers import contains_lao_text
+from utils.glyph_atlas import draw_numeric_text
 from contants import PRINTER_WIDTH
 
 def render_item_line(name, qty, price, total, font_size=18):
@@ -22,7 +23,7 @@ def render_item_line(name, qty, price, total, font_size=18):
     # Load font
     try:
         if font_path and os.path.exists(font_path):
-            font = ImageFont.truetype(font_path, font_size)
+            font = get_truetype_font(font_path, font_size)
         else:
             font = ImageFont.load_default()
     except:
@@ -56,9 +57,10 @@ def render_item_line(name, qty, price, total, font_size=18):
     else:
         draw.text((name_x, 2), display_name, font=font, fill=0)
     
-    draw.text((qty_x, 2), qty_str, font=font, fill=0)
-    draw.text((price_x, 2), price_str, font=font, fill=0)
-    draw.text((total_x, 2), total_str, font=font, fill=0)
+    # Numeric columns are blitted from the pre-rasterized glyph atlas
+    draw_numeric_text(img, draw, (qty_x, 2), qty_str, font)
+    draw_numeric_text(img, draw, (price_x, 2), price_str, font)
+    draw_numeric_text(img, draw, (total_x, 2), total_str, font)
     
     return img
 
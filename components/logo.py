@@ -0,0 +1,89 @@
+import os
+from PIL import Image, ImageOps
+from escpos.printer import Dummy
+from contants import LOGO_CACHE, PRINTER_WIDTH
+from utils.files import file_sha256
+
+# Encoded logos by (path, mtime, size, options); avoids re-hashing the file on every print
+_logo_bytes = {}
+
+def render_logo(image_path, width=PRINTER_WIDTH, dither=True, threshold=128, center=True):
+    """Prepare a logo as a 1-bit image: flattened, scaled to fit width, trimmed and dithered"""
+    img = Image.open(image_path)
+    img.load()
+
+    # Transparent areas print as paper, not black
+    if img.mode in ("RGBA", "LA", "P"):
+        img = img.convert("RGBA")
+        background = Image.new("RGBA", img.size, (255, 255, 255, 255))
+        img = Image.alpha_composite(background, img)
+    img = img.convert("L")
+
+    # Trim the white border before scaling so the ink uses the full width
+    bbox = ImageOps.invert(img).point(lambda v: 255 if v >= 256 - threshold else 0).getbbox()
+    if bbox:
+        img = img.crop(bbox)
+
+    if img.width > width:
+        height = max(1, round(img.height * width / img.width))
+        img = img.resize((width, height), Image.Resampling.LANCZOS)
+
+    if dither:
+        img = img.convert("1", dither=Image.Dither.FLOYDSTEINBERG)
+    else:
+        img = img.point(lambda v: 255 if v >= threshold else 0).convert("1", dither=Image.Dither.NONE)
+
+    if center and img.width < width:
+        canvas = Image.new("1", (width, img.height), 1)
+        canvas.paste(img, ((width - img.width) // 2, 0))
+        img = canvas
+    return img
+
+def encode_logo_raster(image_path, width=PRINTER_WIDTH, dither=True, threshold=128, center=True,
+                       high_density=True, cache_dir=LOGO_CACHE):
+    """Encode a logo to ESC/POS raster bytes once; cached in memory and on disk by source hash.
+
+    Pass cache_dir=None to keep the encoded logo in memory only.
+    """
+    stat = os.stat(image_path)
+    options = (width, dither, threshold, center, high_density)
+    key = (os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size) + options
+    data = _logo_bytes.get(key)
+    if data is not None:
+        return data
+
+    cache_path = None
+    if cache_dir:
+        mode = "dither" if dither else f"t{threshold}"
+        name = (f"{file_sha256(image_path)}-w{width}-{mode}"
+                f"{'-c' if center else ''}{'-hd' if high_density else ''}.bin")
+        cache_path = os.path.join(cache_dir, name)
+        if os.path.exists(cache_path):
+            with open(cache_path, "rb") as f:
+                data = f.read()
+
+    if data is None:
+        printer = Dummy()
+        printer.image(render_logo(image_path, width, dither, threshold, center), impl="bitImageRaster",
+                      high_density_vertical=high_density, high_density_horizontal=high_density)
+        data = printer.output
+
+        if cache_path:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+
+    _logo_bytes[key] = data
+    return data
+
+def print_logo(printer, image_path, width=PRINTER_WIDTH, dither=True, threshold=128, center=True,
+               high_density=True, cache_dir=LOGO_CACHE):
+    """Print a prepared logo; after the first print this is a plain byte copy"""
+    if not image_path or not os.path.exists(image_path):
+        print(f"Logo not found: {image_path}")
+        return False
+
+    printer._raw(encode_logo_raster(image_path, width, dither, threshold, center, high_density, cache_dir))
+    return True
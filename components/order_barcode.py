@@ -0,0 +1,69 @@
+from functools import lru_cache
+import barcode
+from barcode.writer import ImageWriter
+from escpos.constants import BARCODE_TYPE_A, BARCODE_TYPE_B
+from escpos.printer import Dummy
+from contants import PRINTER_DPI
+
+MM_PER_INCH = 25.4
+
+def native_barcode_function(printer, bc="CODE128"):
+    """Return the GS k function type ("A" or "B") the printer can draw bc with, or None"""
+    bc = bc.upper()
+    if bc in BARCODE_TYPE_A and printer.profile.supports("barcodeA"):
+        return "A"
+    # Function B covers the A types plus CODE93, CODE128 and GS1
+    if bc in BARCODE_TYPE_B and printer.profile.supports("barcodeB"):
+        return "B"
+    return None
+
+def supports_native_barcode(printer, bc="CODE128"):
+    """Check if the printer profile can draw this 1D barcode type itself (GS k)"""
+    return native_barcode_function(printer, bc) is not None
+
+@lru_cache(maxsize=64)
+def render_barcode(code, bc="CODE128", height=64, width=2):
+    """Render a barcode (e.g. order number) as a 1-bit image, cached by arguments.
+
+    height is the bar height and width the module width, both in printer dots,
+    matching the native GS k parameters.
+    """
+    writer_options = {
+        "module_width": width * MM_PER_INCH / PRINTER_DPI,
+        "module_height": height * MM_PER_INCH / PRINTER_DPI,
+        "dpi": PRINTER_DPI,
+        "quiet_zone": 2,
+        "write_text": False,
+    }
+    code_class = barcode.get_barcode_class(bc.lower())
+    return code_class(code, writer=ImageWriter(mode="1")).render(writer_options)
+
+@lru_cache(maxsize=64)
+def encode_barcode_raster(code, bc="CODE128", height=64, width=2):
+    """Encode the barcode raster to ESC/POS image bytes once so reprints are a byte copy"""
+    printer = Dummy()
+    printer.image(render_barcode(code, bc, height, width), impl="bitImageRaster")
+    return printer.output
+
+def print_barcode(printer, code, bc="CODE128", height=64, width=2, native=None):
+    """Print a barcode natively when the printer supports it, otherwise as cached raster"""
+    if not code:
+        return False
+
+    if native is None:
+        native = supports_native_barcode(printer, bc)
+
+    # Centered on both paths, then back to left so following lines are unaffected
+    printer.set(align="center")
+    if native:
+        native_code = code
+        if bc.upper() == "CODE128":
+            # GS k CODE128 needs a code set selector (set B covers order numbers),
+            # and "{" starts a control sequence, so literal braces are doubled
+            native_code = "{B" + code.replace("{", "{{")
+        printer.barcode(native_code, bc, height=height, width=width, pos="OFF", align_ct=False,
+                        function_type=native_barcode_function(printer, bc) or "B")
+    else:
+        printer._raw(encode_barcode_raster(code, bc, height, width))
+    printer.set(align="left")
+    return native
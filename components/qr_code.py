@@ -0,0 +1,54 @@
+from functools import lru_cache
+import qrcode
+from escpos.constants import QR_ECLEVEL_H, QR_ECLEVEL_L, QR_ECLEVEL_M, QR_ECLEVEL_Q
+from escpos.printer import Dummy
+
+# Error correction levels accepted by the QR functions
+QR_ERROR_LEVELS = {
+    "L": (QR_ECLEVEL_L, qrcode.constants.ERROR_CORRECT_L),
+    "M": (QR_ECLEVEL_M, qrcode.constants.ERROR_CORRECT_M),
+    "Q": (QR_ECLEVEL_Q, qrcode.constants.ERROR_CORRECT_Q),
+    "H": (QR_ECLEVEL_H, qrcode.constants.ERROR_CORRECT_H),
+}
+
+def supports_native_qr(printer):
+    """Check if the printer profile can draw QR codes itself (GS ( k)"""
+    return printer.profile.supports("qrCode")
+
+@lru_cache(maxsize=64)
+def render_qr_code(payload, size=6, error_level="M"):
+    """Render a QR code (e.g. Lao QR payment payload) as a 1-bit image, cached by arguments"""
+    qr = qrcode.QRCode(
+        version=None,
+        box_size=size,
+        border=1,
+        error_correction=QR_ERROR_LEVELS[error_level][1]
+    )
+    qr.add_data(payload)
+    qr.make(fit=True)
+    return qr.make_image().get_image().convert("1")
+
+@lru_cache(maxsize=64)
+def encode_qr_raster(payload, size=6, error_level="M"):
+    """Encode the QR raster to ESC/POS image bytes once so reprints are a byte copy"""
+    printer = Dummy()
+    printer.image(render_qr_code(payload, size, error_level), impl="bitImageRaster")
+    return printer.output
+
+def print_qr_code(printer, payload, size=6, error_level="M", native=None):
+    """Print a QR code natively when the printer supports it, otherwise as cached raster"""
+    if not payload:
+        return False
+
+    if native is None:
+        native = supports_native_qr(printer)
+
+    # Centered on both paths, then back to left so following lines are unaffected
+    printer.set(align="center")
+    if native:
+        # Only the payload and a few setup bytes go over the wire
+        printer.qr(payload, ec=QR_ERROR_LEVELS[error_level][0], size=size, native=True)
+    else:
+        printer._raw(encode_qr_raster(payload, size, error_level))
+    printer.set(align="left")
+    return native
@@ -1,6 +1,6 @@
 from PIL import Image, ImageDraw, ImageFont
 import os
-from utils.fonts import download_direct_font, get_system_font_fallback
+from utils.fonts import download_direct_font, get_system_font_fallback, get_truetype_font
 from utils.helpers import contains_lao_text
 from contants import PRINTER_WIDTH
 
@@ -17,7 +17,7 @@ def render_receipt_line(text, font_path=None, font_size=18, max_width_pixels=PRI
     # Load font
     try:
         if font_path and os.path.exists(font_path):
-            font = ImageFont.truetype(font_path, font_size)
+            font = get_truetype_font(font_path, font_size)
         else:
             font = ImageFont.load_default()
             print("Using PIL default font")
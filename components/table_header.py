@@ -1,6 +1,6 @@
 from PIL import Image, ImageDraw, ImageFont
 import os
-from utils.fonts import get_system_font_fallback
+from utils.fonts import get_system_font_fallback, get_truetype_font
 from contants import PRINTER_WIDTH
 
 def render_table_header(font_size=16):
@@ -9,7 +9,7 @@ def render_table_header(font_size=16):
     
     try:
         if font_path and os.path.exists(font_path):
-            font = ImageFont.truetype(font_path, font_size)
+            font = get_truetype_font(font_path, font_size)
         else:
             font = ImageFont.load_default()
     except:
@@ -1,6 +1,7 @@
 from PIL import Image, ImageDraw, ImageFont
 import os
-from utils.fonts import get_system_font_fallback
+from utils.fonts import get_system_font_fallback, get_truetype_font
+from utils.glyph_atlas import draw_numeric_text
 from contants import PRINTER_WIDTH
 
 def render_total_line(label, amount, font_size=18, bold=False):
@@ -9,7 +10,7 @@ def render_total_line(label, amount, font_size=18, bold=False):
     
     try:
         if font_path and os.path.exists(font_path):
-            font = ImageFont.truetype(font_path, font_size)
+            font = get_truetype_font(font_path, font_size)
         else:
             font = ImageFont.load_default()
     except:
@@ -29,6 +30,6 @@ def render_total_line(label, amount, font_size=18, bold=False):
     amount_x = 480  # Align with total column from items
     
     draw.text((label_x, 2), label_text, font=font, fill=0)
-    draw.text((amount_x, 2), amount_text, font=font, fill=0)
+    draw_numeric_text(img, draw, (amount_x, 2), amount_text, font)
     
     return img
\ No newline at end of file
@@ -1,4 +1,5 @@
 # Configuration
 FONT_CACHE = "font_cache"
+LOGO_CACHE = "logo_cache"  # Encoded logo raster bytes
 PRINTER_WIDTH = 576  # 80mm paper (576 pixels)
 PRINTER_DPI = 203    # Common thermal printer resolution
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""Prepare instanced, subsetted receipt fonts in font_cache/.
+
+Run once when provisioning a machine; afterwards the font resolver uses the
+subsets and needs no network access.
+
+Examples:
+    python prepare_fonts.py
+    python prepare_fonts.py NotoSansLao --force
+"""
+import argparse
+import sys
+from utils.font_subset import FONT_SUBSETS, prepare_font
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Subset receipt fonts to the glyphs they use")
+    parser.add_argument("fonts", nargs="*", default=list(FONT_SUBSETS), help="Font names to prepare")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the source is unchanged")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for font_name in args.fonts:
+        try:
+            prepare_font(font_name, force=args.force)
+        except Exception as e:
+            print(f"Could not prepare {font_name}: {e}")
+            failed += 1
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
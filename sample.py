@@ -1,11 +1,5 @@
 from escpos.printer import Usb
-from utils.helpers import print_image_text
-from components import (
-    render_receipt_line,
-    render_item_line,
-    render_table_header,
-    render_total_line
-)
+from utils.receipt import write_receipt
 
 def print_receipt():
     """Example receipt using font detection for all text"""
@@ -14,24 +8,6 @@ def print_receipt():
         # Initialize printer (your specific device)
         printer = Usb(0x1fc9, 0x2016, in_ep=0x82, out_ep=0x01)
         
-        # Print header with image rendering
-        print_image_text(printer, "P2G Shop", font_size=36, align="center")
-        print_image_text(printer, "Tel: (555) 123-4567", font_size=18, align="center")
-        print_image_text(printer, "2025-03-15 14:30", font_size=18, align="center")
-        
-        # Add spacing
-        printer.text("\n")
-        
-        # Print table header as image for consistency
-        header_image = render_receipt_line("-" * 80, font_size=26)
-        printer.image(header_image, impl="bitImageRaster")
-        
-        table_header_image = render_table_header(font_size=22)
-        printer.image(table_header_image, impl="bitImageRaster")
-        
-        separator_image = render_receipt_line("-" * 80, font_size=26)
-        printer.image(separator_image, impl="bitImageRaster")
-        
         # Example items with properly positioned Lao text
         items = [
             ("ແກງຈືດໝູຕົ້ມ", 0, 0.00),
@@ -46,41 +22,7 @@ def print_receipt():
             ("ກູກິ້ວ", 1, 3.00),         # Noodles (ກ + ູ + ກ + ິ + ວ)
         ]
         
-        # Print each item using unified image rendering for perfect alignment
-        for name, qty, price in items:
-            line_total = qty * price
-            
-            # Render entire line as image for consistent formatting
-            item_image = render_item_line(name, qty, price, line_total, font_size=22)
-            printer.image(item_image, impl="bitImageRaster", high_density_vertical=True, high_density_horizontal=True)
-        
-        # Calculate total
-        subtotal = sum(qty * price for _, qty, price in items)
-        tax = subtotal * 0.0825
-        total = subtotal + tax
-        
-        # Print totals as images for consistency
-        separator_image = render_receipt_line("-" * 80, font_size=26)
-        printer.image(separator_image, impl="bitImageRaster")
-        
-        subtotal_image = render_total_line("SUBTOTAL:", subtotal, font_size=22)
-        printer.image(subtotal_image, impl="bitImageRaster")
-
-        tax_image = render_total_line("TAX:", tax, font_size=22)
-        printer.image(tax_image, impl="bitImageRaster")
-        
-        total_image = render_total_line("TOTAL:", total, font_size=24)
-        printer.image(total_image, impl="bitImageRaster")
-        
-        # Add spacing
-        printer.text("\n")
-        
-        # Footer with image rendering
-        print_image_text(printer, "Thank you for your purchase!", font_size=20, align="center")
-        print_image_text(printer, "Returns within 14 days", font_size=16, align="center")
-        
-        # Finalize
-        printer.cut()
+        write_receipt(printer, items)
         return True
     except Exception as e:
         print(f"Printer error: {e}")
@@ -0,0 +1,144 @@
+"""Render receipts to ESC/POS spool files and replay them to a printer.
+
+Examples:
+    python spool_receipts.py render receipts-2025-03-15.json --out spool/2025-03-15
+    python spool_receipts.py replay spool/2025-03-15/A0001.spool --host 192.168.1.50
+    python spool_receipts.py info spool/2025-03-15/A0001.spool
+
+The receipts file is a JSON list of receipts, each one like:
+    {"job_id": "A0001", "timestamp": "2025-03-15 14:30", "order_number": "A0001",
+     "items": [["ເບຍລາວ", 1, 4.99], ["ກາເຟ", 1, 12.99]]}
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from utils.receipt import write_receipt
+from utils.spool import (
+    SPOOL_EXTENSION,
+    read_spool_header,
+    render_to_bytes,
+    replay_spool,
+    verify_spool,
+    write_spool
+)
+
+# Optional write_receipt arguments that a receipt entry may carry
+RECEIPT_FIELDS = ("shop_name", "phone", "timestamp", "tax_rate", "qr_payload", "order_number",
+                 "logo_path")
+
+def safe_file_name(job_id, fallback):
+    """Turn a job id into a file name that cannot leave the output directory"""
+    name = re.sub(r"[^A-Za-z0-9._-]", "_", job_id).lstrip(".")
+    return name or str(fallback)
+
+def render_day(receipts_path, out_dir, profile=None):
+    """Render every receipt in a JSON file to its own spool file"""
+    with open(receipts_path, encoding="utf-8") as f:
+        receipts = json.load(f)
+    if not isinstance(receipts, list):
+        raise ValueError("Receipts file must contain a JSON list of receipts")
+
+    written = []
+    failed = []
+    for index, receipt in enumerate(receipts):
+        job_id = str(index + 1)
+        try:
+            if not isinstance(receipt, dict):
+                raise ValueError("receipt entry is not a JSON object")
+            job_id = str(receipt.get("job_id", index + 1))
+            kwargs = {k: receipt[k] for k in RECEIPT_FIELDS if k in receipt}
+            items = [tuple(item) for item in receipt["items"]]
+
+            data = render_to_bytes(write_receipt, items, profile=profile, **kwargs)
+            name = safe_file_name(job_id, index + 1)
+            path = os.path.join(out_dir, f"{name}{SPOOL_EXTENSION}")
+            if path in written:
+                # Two job ids sanitized to the same name; keep both receipts
+                path = os.path.join(out_dir, f"{name}-{index + 1}{SPOOL_EXTENSION}")
+            write_spool(path, data, job_id=job_id, profile=profile or "")
+        except Exception as e:
+            # One bad receipt should not stop the rest of the day's batch
+            print(f"Failed to spool {job_id}: {e}")
+            failed.append(job_id)
+            continue
+        written.append(path)
+        print(f"Spooled {job_id}: {len(data)} bytes -> {path}")
+    return written, failed
+
+def open_printer(args, profile=None):
+    """Open the printer connection selected on the command line"""
+    if args.host:
+        from escpos.printer import Network
+        return Network(args.host, port=args.port, profile=profile)
+    if args.usb:
+        from escpos.printer import Usb
+        vendor_id, product_id = (int(part, 16) for part in args.usb.split(":"))
+        return Usb(vendor_id, product_id, in_ep=0x82, out_ep=0x01, profile=profile)
+    raise ValueError("No printer selected, use --host or --usb")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-rendered ESC/POS spool files")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    render_parser = subparsers.add_parser("render", help="Render a day's receipts to spool files")
+    render_parser.add_argument("receipts", help="JSON file with a list of receipts")
+    render_parser.add_argument("--out", required=True, help="Output directory for spool files")
+    render_parser.add_argument("--profile", default=None, help="escpos printer profile name")
+
+    replay_parser = subparsers.add_parser("replay", help="Send spool files to a printer")
+    replay_parser.add_argument("spools", nargs="+", help="Spool files to print")
+    replay_parser.add_argument("--host", help="Network printer address")
+    replay_parser.add_argument("--port", type=int, default=9100, help="Network printer port")
+    replay_parser.add_argument("--usb", help="USB printer as VENDOR:PRODUCT in hex, e.g. 1fc9:2016")
+
+    info_parser = subparsers.add_parser("info", help="Show spool file headers")
+    info_parser.add_argument("spools", nargs="+", help="Spool files to inspect")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "render":
+        try:
+            written, failed = render_day(args.receipts, args.out, profile=args.profile)
+        except (OSError, ValueError) as e:
+            print(f"Cannot read receipts from {args.receipts}: {e}")
+            return 1
+        print(f"Spooled {len(written)} receipts, {len(failed)} failed")
+        return 1 if failed else 0
+
+    if args.command == "info":
+        bad = 0
+        for path in args.spools:
+            try:
+                header = read_spool_header(path)
+            except (OSError, ValueError) as e:
+                print(f"{path}: BAD SPOOL ({e})")
+                bad += 1
+                continue
+            ok = verify_spool(path)
+            bad += not ok
+            status = "ok" if ok else "CHECKSUM MISMATCH"
+            print(f"{path}: job={header['job_id']} profile={header['profile'] or '-'} "
+                  f"bytes={header['length']} crc32={header['checksum']:08x} {status}")
+        return 1 if bad else 0
+
+    printer = None
+    try:
+        printer = open_printer(args, profile=read_spool_header(args.spools[0])["profile"] or None)
+        for path in args.spools:
+            header = replay_spool(path, printer)
+            print(f"Replayed {header['job_id']} ({header['length']} bytes)")
+        return 0
+    except Exception as e:
+        print(f"Replay failed: {e}")
+        return 1
+    finally:
+        try:
+            if printer is not None:
+                printer.close()
+        except:
+            pass
+
+if __name__ == "__main__":
+    sys.exit(main())
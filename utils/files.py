@@ -0,0 +1,9 @@
+import hashlib
+
+def file_sha256(path):
+    """SHA-256 hex digest of a file, read in large chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,127 @@
+import json
+import os
+from contants import FONT_CACHE
+from utils.files import file_sha256
+
+MANIFEST_NAME = "manifest.json"
+
+_manifest_cache = {}
+_file_hashes = {}
+
+# Glyphs receipts actually use: Lao, Latin, digits/punctuation and currency signs
+RECEIPT_UNICODES = (
+    list(range(0x0020, 0x007F))     # Basic Latin (digits, punctuation)
+    + list(range(0x00A0, 0x0100))   # Latin-1 Supplement
+    + list(range(0x0E80, 0x0F00))   # Lao
+    + list(range(0x2010, 0x2028))   # Dashes, quotes, ellipsis
+    + [0x0E3F, 0x20AC, 0x20AD]      # ฿ € ₭
+    + [0x200B, 0x200C, 0x200D, 0x25CC]  # Zero-width chars, dotted circle for marks
+)
+
+# Fonts to prepare: variable axes are pinned to the single instance we print with
+FONT_SUBSETS = {
+    "NotoSansLao": {"axes": {"wght": 400, "wdth": 100}},
+}
+
+def subset_font_path(font_name):
+    return os.path.join(FONT_CACHE, f"{font_name}-subset.ttf")
+
+def load_manifest():
+    """Read the subset manifest from the font cache (empty if missing or invalid)"""
+    path = os.path.join(FONT_CACHE, MANIFEST_NAME)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        # Resolved on every rendered line, so only re-read when the file changes
+        if _manifest_cache.get("mtime") != mtime:
+            with open(path, encoding="utf-8") as f:
+                _manifest_cache["manifest"] = json.load(f)
+            _manifest_cache["mtime"] = mtime
+        return dict(_manifest_cache["manifest"])
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(manifest):
+    path = os.path.join(FONT_CACHE, MANIFEST_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def cached_file_sha256(path):
+    """SHA-256 of a file, re-hashed only when its mtime or size changes"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    digest = _file_hashes.get(key)
+    if digest is None:
+        digest = _file_hashes[key] = file_sha256(path)
+    return digest
+
+def find_subset_font(font_name):
+    """Return the prepared subset path for font_name, or None if there is no usable one.
+
+    A subset is used when it exists and its source still has the hash recorded in
+    the manifest. It is also used when the source is gone, so no download is needed.
+    """
+    entry = load_manifest().get(font_name)
+    if not entry:
+        return None
+
+    subset_path = os.path.join(FONT_CACHE, entry["subset"])
+    if not os.path.exists(subset_path):
+        return None
+
+    source_path = os.path.join(FONT_CACHE, entry["source"])
+    if os.path.exists(source_path) and cached_file_sha256(source_path) != entry["source_sha256"]:
+        return None
+    return subset_path
+
+def prepare_font(font_name, force=False):
+    """Create an instanced, subsetted static TTF for font_name and record it in the manifest"""
+    from fontTools.ttLib import TTFont
+    from fontTools.subset import Options, Subsetter
+    from fontTools.varLib import instancer
+    from utils.fonts import download_direct_font
+
+    source_path = os.path.join(FONT_CACHE, f"{font_name}.ttf")
+    if not os.path.exists(source_path):
+        source_path = download_direct_font(font_name, prefer_subset=False)
+        if not source_path:
+            raise Exception(f"Source font not available: {font_name}")
+
+    source_hash = file_sha256(source_path)
+    manifest = load_manifest()
+    entry = manifest.get(font_name)
+    subset_path = subset_font_path(font_name)
+    if (not force and entry and entry["source_sha256"] == source_hash
+            and os.path.exists(subset_path)):
+        print(f"Subset up to date: {subset_path}")
+        return subset_path
+
+    font = TTFont(source_path)
+    axes = FONT_SUBSETS.get(font_name, {}).get("axes", {})
+    if "fvar" in font:
+        # Pin every axis; unlisted axes stay at their default value
+        limits = {axis.axisTag: axes.get(axis.axisTag, axis.defaultValue) for axis in font["fvar"].axes}
+        font = instancer.instantiateVariableFont(font, limits)
+
+    options = Options()
+    options.layout_features = ["*"]  # Keep GSUB/GPOS so Lao marks still position
+    options.notdef_outline = True
+    options.name_IDs = ["*"]
+    subsetter = Subsetter(options=options)
+    subsetter.populate(unicodes=RECEIPT_UNICODES)
+    subsetter.subset(font)
+    font.save(subset_path)
+
+    manifest[font_name] = {
+        "source": os.path.basename(source_path),
+        "source_sha256": source_hash,
+        "source_size": os.path.getsize(source_path),
+        "subset": os.path.basename(subset_path),
+        "subset_size": os.path.getsize(subset_path),
+        "axes": axes,
+    }
+    save_manifest(manifest)
+    print(f"Prepared {font_name}: {manifest[font_name]['source_size']} -> "
+          f"{manifest[font_name]['subset_size']} bytes ({subset_path})")
+    return subset_path
@@ -1,6 +1,26 @@
 import os
+import threading
 import requests
+from PIL import ImageFont
 from contants import FONT_CACHE
+from utils.font_subset import find_subset_font
+
+# FreeType faces must not be used from two threads at once, so each thread
+# keeps its own handles; calls on the same thread share them
+_thread_fonts = threading.local()
+
+def get_truetype_font(font_path, font_size):
+    """Load a TrueType font once per (path, size) per thread and reuse it"""
+    fonts = getattr(_thread_fonts, "fonts", None)
+    if fonts is None:
+        fonts = _thread_fonts.fonts = {}
+
+    key = (font_path, font_size)
+    font = fonts.get(key)
+    if font is None:
+        font = ImageFont.truetype(font_path, font_size)
+        fonts[key] = font
+    return font
 
 def download_font(font_url, font_name):
     """Download and cache Google Font - extracts TTF URL from CSS"""
@@ -63,8 +83,14 @@ def get_system_font_fallback():
     # If no system fonts found, return None (will use PIL default)
     return None
 
-def download_direct_font(font_name="NotoSansLao"):
-    """Download font directly from known URLs"""
+def download_direct_font(font_name="NotoSansLao", prefer_subset=True):
+    """Download font directly from known URLs, preferring a prepared subset if there is one"""
+    if prefer_subset:
+        subset_path = find_subset_font(font_name)
+        if subset_path:
+            print(f"Using subset font: {font_name}")
+            return subset_path
+
     os.makedirs(FONT_CACHE, exist_ok=True)
     font_path = os.path.join(FONT_CACHE, f"{font_name}.ttf")
     
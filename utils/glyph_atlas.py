@@ -0,0 +1,163 @@
+import threading
+from PIL import Image, ImageDraw, ImageFont
+
+# Characters that make up the numeric columns (qty/price/total/amount)
+NUMERIC_CHARS = "0123456789.,- "
+CURRENCY_CHARS = "₭$฿€"
+
+_atlas_cache = {}
+_atlas_lock = threading.Lock()
+
+def _render_ink(font, text):
+    """Render text like draw.text on a padded 1-bit image (ink = 1); return (image, origin)"""
+    left, top, right, bottom = font.getbbox(text, mode="1")
+    pad = 4
+    img = Image.new("1", (right - min(left, 0) + 2 * pad, bottom - min(top, 0) + 2 * pad), 0)
+    origin = (pad - min(left, 0), pad - min(top, 0))
+    ImageDraw.Draw(img).text(origin, text, font=font, fill=1)
+    return img, origin
+
+class GlyphAtlas:
+    """Pre-rasterized 1-bit glyph cells for one (font, size), built once.
+
+    Advances use the monochrome ("1" mode) metrics that ImageDraw.text uses on
+    the 1-bit receipt images. Pillow places a string by its outline box but
+    stacks the hinted bitmaps from their own leftmost/topmost edge, and the two
+    can disagree by a pixel (",", "₭", "." at small sizes). Each cell is
+    therefore measured inside a probe string and draw() reapplies the
+    string-level shift, keeping composed strings pixel-identical to draw.text.
+    """
+
+    def __init__(self, font, chars=NUMERIC_CHARS + CURRENCY_CHARS):
+        self.font = font
+        self.cells = {}
+        self.advances = {}
+        self.boxes = {}
+        self.kerning = {}
+
+        solo = {}
+        for char in chars:
+            self.advances[char] = int(font.getlength(char, mode="1"))
+            self.boxes[char] = font.getbbox(char, mode="1")[:2]
+            img, (origin_x, origin_y) = _render_ink(font, char)
+            bbox = img.getbbox()
+            solo[char] = (img.crop(bbox), bbox[0] - origin_x, bbox[1] - origin_y) if bbox else None
+
+        # Pair adjustments (kerning) between atlas characters
+        for first in chars:
+            for second in chars:
+                pair_width = int(font.getlength(first + second, mode="1"))
+                delta = pair_width - self.advances[first] - self.advances[second]
+                if delta:
+                    self.kerning[(first, second)] = delta
+
+        # A reference glyph with a positive left bearing leads every probe, so
+        # cells get their x offset from the pen and their y offset relative to
+        # the reference ink (only relative offsets matter vertically)
+        reference = next(
+            (char for char in chars
+             if solo[char] is not None and self.boxes[char][0] >= 0 and solo[char][1] > 0),
+            None
+        )
+        if reference is None:
+            # Nothing to calibrate against; supports() is then always False
+            return
+        measured = {reference: (solo[reference][0], solo[reference][1], 0)}
+        for char in chars:
+            if char == reference or solo[char] is None:
+                continue
+
+            probe = reference + "    " + char
+            pen = int(font.getlength(probe, mode="1")) - self.advances[char]
+            img, (origin_x, origin_y) = _render_ink(font, probe)
+
+            # Split the probe in the middle of the space gap
+            split_x = origin_x + (self.advances[reference] + pen) // 2
+            reference_bbox = img.crop((0, 0, split_x, img.height)).getbbox()
+            right = img.crop((split_x, 0, img.width, img.height))
+            bbox = right.getbbox()
+            measured[char] = (
+                right.crop(bbox),
+                split_x + bbox[0] - origin_x - pen,
+                bbox[1] - reference_bbox[1],
+            )
+
+        # Hinted bitmaps can carry blank rows/columns, so the bitmap edge used
+        # for placement is recovered from where the glyph lands on its own
+        for char in chars:
+            if solo[char] is None:
+                self.cells[char] = None
+                continue
+            cell, ink_x, ink_y = measured[char]
+            box_x, box_y = self.boxes[char]
+            bitmap_x = ink_x - (solo[char][1] - min(box_x, 0))
+            bitmap_y = ink_y - (solo[char][2] - box_y)
+            self.cells[char] = (cell, ink_x, ink_y, bitmap_x, bitmap_y)
+
+    def supports(self, text):
+        """Check if every character of text has an atlas cell"""
+        return all(char in self.cells for char in text)
+
+    def glyph_positions(self, text):
+        """Yield (char, pen_x) for each character using atlas advances"""
+        pen_x = 0
+        previous = None
+        for char in text:
+            if previous is not None:
+                pen_x += self.kerning.get((previous, char), 0)
+            yield char, pen_x
+            pen_x += self.advances[char]
+            previous = char
+
+    def text_width(self, text):
+        """Advance width of text from atlas metrics (no textbbox call)"""
+        width = 0
+        for char, pen_x in self.glyph_positions(text):
+            width = pen_x + self.advances[char]
+        return width
+
+    def draw(self, img, position, text, fill=0, align="left"):
+        """Blit text onto a 1-bit image at position; align="right" ends at position"""
+        x, y = position
+        if align == "right":
+            x -= self.text_width(text)
+
+        glyphs = list(self.glyph_positions(text))
+        inked = [(pen_x, self.cells[char]) for char, pen_x in glyphs if self.cells[char] is not None]
+        if not inked:
+            return
+
+        # Outline box origin of the whole string versus its bitmap origin
+        box_x = min([0] + [pen_x + self.boxes[char][0] for char, pen_x in glyphs])
+        box_y = min(self.boxes[char][1] for char, _ in glyphs)
+        shift_x = box_x - min([0] + [pen_x + cell[3] for pen_x, cell in inked])
+        shift_y = box_y - min(cell[4] for _, cell in inked)
+
+        for pen_x, (cell, ink_x, ink_y, _, _) in inked:
+            img.paste(fill, (x + pen_x + ink_x + shift_x, y + ink_y + shift_y), cell)
+
+def get_glyph_atlas(font):
+    """Return the cached atlas for a FreeType font, or None if it can't have one"""
+    if not isinstance(font, ImageFont.FreeTypeFont):
+        return None
+
+    # load_default() hands out a fresh in-memory font each call, so key on the name
+    source = font.path if isinstance(font.path, str) else font.getname()
+    key = (source, font.size, font.index, font.layout_engine)
+    atlas = _atlas_cache.get(key)
+    if atlas is None:
+        # Built once; cells are read-only afterwards so threads can share them
+        with _atlas_lock:
+            atlas = _atlas_cache.get(key)
+            if atlas is None:
+                atlas = GlyphAtlas(font)
+                _atlas_cache[key] = atlas
+    return atlas
+
+def draw_numeric_text(img, draw, position, text, font, fill=0):
+    """Draw a numeric string through the glyph atlas, falling back to draw.text"""
+    atlas = get_glyph_atlas(font) if img.mode == "1" else None
+    if atlas is not None and atlas.supports(text):
+        atlas.draw(img, position, text, fill=fill)
+    else:
+        draw.text(position, text, font=font, fill=fill)
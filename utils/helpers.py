@@ -1,6 +1,6 @@
 import os
 import unicodedata
-from utils.fonts import get_system_font_fallback, download_direct_font
+from utils.fonts import get_system_font_fallback, download_direct_font, get_truetype_font
 from PIL import Image, ImageDraw, ImageFont
 import contants
 
@@ -12,12 +12,12 @@ def render_text_image(text, font_path, font_size=24, align="center", max_width_p
     # Load font
     try:
         if font_path and os.path.exists(font_path):
-            font = ImageFont.truetype(font_path, font_size)
+            font = get_truetype_font(font_path, font_size)
         else:
             # Try system font fallback
             system_font = get_system_font_fallback()
             if system_font:
-                font = ImageFont.truetype(system_font, font_size)
+                font = get_truetype_font(system_font, font_size)
             else:
                 # Use PIL default font
                 font = ImageFont.load_default()
@@ -28,7 +28,7 @@ def render_text_image(text, font_path, font_size=24, align="center", max_width_p
         system_font = get_system_font_fallback()
         if system_font:
             try:
-                font = ImageFont.truetype(system_font, font_size)
+                font = get_truetype_font(system_font, font_size)
                 print(f"Using system font fallback: {system_font}")
             except:
                 font = ImageFont.load_default()
@@ -0,0 +1,103 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from utils.helpers import print_image_text
+from components import (
+    render_receipt_line,
+    render_item_line,
+    render_table_header,
+    render_total_line,
+    print_qr_code,
+    print_barcode,
+    print_logo
+)
+
+_executors = {}
+
+def _run_line_job(job):
+    func, args, kwargs = job
+    return func(*args, **kwargs)
+
+def render_lines(line_jobs, workers=None):
+    """Render (func, args, kwargs) line jobs, on a process pool if workers > 1; keeps job order
+
+    Pillow holds the GIL while rendering text and the Lao layout is pure Python,
+    so threads cannot help; separate processes can. workers is capped at the
+    CPU count, so a single-core machine always renders serially.
+    """
+    workers = min(workers or 1, os.cpu_count() or 1)
+    if workers <= 1:
+        return [_run_line_job(job) for job in line_jobs]
+
+    # Reuse the pool between receipts so worker processes (and their fonts) stay warm
+    executor = _executors.get(workers)
+    if executor is None:
+        executor = _executors.setdefault(workers, ProcessPoolExecutor(max_workers=workers))
+    # Send lines in batches to keep pickling round trips down
+    chunksize = max(1, len(line_jobs) // (workers * 4))
+    return list(executor.map(_run_line_job, line_jobs, chunksize=chunksize))
+
+def write_receipt(printer, items, shop_name="P2G Shop", phone="Tel: (555) 123-4567",
+                  timestamp="2025-03-15 14:30", tax_rate=0.0825, qr_payload=None, order_number=None,
+                  workers=None, logo_path=None):
+    """Write a complete receipt to any printer (Usb, Network, Dummy, ...)
+
+    With workers > 1 the receipt lines are rendered in parallel worker processes
+    (only useful on multi-core machines with long receipts).
+    """
+    # Shop logo, prepared once and then copied as raster bytes
+    if logo_path:
+        print_logo(printer, logo_path)
+
+    # Print header with image rendering
+    print_image_text(printer, shop_name, font_size=36, align="center")
+    print_image_text(printer, phone, font_size=18, align="center")
+    print_image_text(printer, timestamp, font_size=18, align="center")
+
+    # Add spacing
+    printer.text("\n")
+
+    # Table header, items and totals are independent lines: build them as
+    # render jobs so they can be rendered in parallel and printed in order
+    separator = (render_receipt_line, ("-" * 80,), {"font_size": 26})
+    line_jobs = [
+        separator,
+        (render_table_header, (), {"font_size": 22}),
+        separator,
+    ]
+
+    # Render entire item line as image for perfect alignment
+    for name, qty, price in items:
+        line_total = qty * price
+        line_jobs.append((render_item_line, (name, qty, price, line_total), {"font_size": 22}))
+
+    # Calculate total
+    subtotal = sum(qty * price for _, qty, price in items)
+    tax = subtotal * tax_rate
+    total = subtotal + tax
+
+    line_jobs += [
+        separator,
+        (render_total_line, ("SUBTOTAL:", subtotal), {"font_size": 22}),
+        (render_total_line, ("TAX:", tax), {"font_size": 22}),
+        (render_total_line, ("TOTAL:", total), {"font_size": 24}),
+    ]
+
+    for line_image in render_lines(line_jobs, workers=workers):
+        printer.image(line_image, impl="bitImageRaster", high_density_vertical=True, high_density_horizontal=True)
+
+    # Add spacing
+    printer.text("\n")
+
+    # Lao QR payment code and order number barcode (native commands when supported)
+    if qr_payload:
+        print_qr_code(printer, qr_payload)
+    if order_number:
+        print_barcode(printer, order_number)
+        print_image_text(printer, order_number, font_size=18, align="center")
+
+    # Footer with image rendering
+    print_image_text(printer, "Thank you for your purchase!", font_size=20, align="center")
+    print_image_text(printer, "Returns within 14 days", font_size=16, align="center")
+
+    # Finalize
+    printer.cut()
@@ -0,0 +1,106 @@
+import os
+import struct
+import zlib
+from escpos.printer import Dummy
+
+# Spool file layout:
+#   magic (8 bytes) | version (u8) | job id length (u16) | profile length (u16)
+#   | payload length (u64) | crc32 of payload (u32) | job id | profile | payload
+SPOOL_MAGIC = b"ESCPOSSP"
+SPOOL_VERSION = 1
+SPOOL_EXTENSION = ".spool"
+_HEADER = struct.Struct("<8sBHHQI")
+_CHUNK_SIZE = 1024 * 1024  # Large sequential reads for replay
+
+def render_to_bytes(write_func, *args, profile=None, **kwargs):
+    """Run a receipt writer against a Dummy printer and return the ESC/POS bytes"""
+    printer = Dummy(profile=profile) if profile else Dummy()
+    write_func(printer, *args, **kwargs)
+    return printer.output
+
+def write_spool(path, data, job_id="", profile=""):
+    """Save an encoded ESC/POS byte stream to a spool file with header"""
+    job_id_bytes = job_id.encode("utf-8")
+    profile_bytes = (profile or "").encode("utf-8")
+    header = _HEADER.pack(
+        SPOOL_MAGIC,
+        SPOOL_VERSION,
+        len(job_id_bytes),
+        len(profile_bytes),
+        len(data),
+        zlib.crc32(data),
+    )
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Write to a temp file first so a crash never leaves a half-written spool
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(job_id_bytes)
+        f.write(profile_bytes)
+        f.write(data)
+    os.replace(tmp_path, path)
+    return path
+
+def _read_header(f):
+    """Read and validate the spool header from an open file"""
+    raw = f.read(_HEADER.size)
+    if len(raw) != _HEADER.size:
+        raise ValueError("Spool file is truncated (incomplete header)")
+
+    magic, version, job_id_len, profile_len, payload_len, checksum = _HEADER.unpack(raw)
+    if magic != SPOOL_MAGIC:
+        raise ValueError("Not a spool file (bad magic)")
+    if version != SPOOL_VERSION:
+        raise ValueError(f"Unsupported spool version: {version}")
+
+    job_id = f.read(job_id_len).decode("utf-8")
+    profile = f.read(profile_len).decode("utf-8")
+    return {
+        "job_id": job_id,
+        "profile": profile,
+        "length": payload_len,
+        "checksum": checksum,
+        "offset": _HEADER.size + job_id_len + profile_len,
+    }
+
+def read_spool_header(path):
+    """Return the header fields (job_id, profile, length, checksum) of a spool file"""
+    with open(path, "rb") as f:
+        return _read_header(f)
+
+def _iter_payload(f, length, chunk_size):
+    """Yield the payload in large sequential chunks"""
+    remaining = length
+    while remaining > 0:
+        chunk = f.read(min(chunk_size, remaining))
+        if not chunk:
+            raise ValueError("Spool file is truncated (incomplete payload)")
+        remaining -= len(chunk)
+        yield chunk
+
+def verify_spool(path, chunk_size=_CHUNK_SIZE):
+    """Check the payload length and checksum of a spool file (False if truncated)"""
+    with open(path, "rb") as f:
+        header = _read_header(f)
+        checksum = 0
+        try:
+            for chunk in _iter_payload(f, header["length"], chunk_size):
+                checksum = zlib.crc32(chunk, checksum)
+        except ValueError:
+            return False
+    return checksum == header["checksum"]
+
+def replay_spool(path, printer, verify=True, chunk_size=_CHUNK_SIZE):
+    """Stream a spool file to a printer connection without re-rendering"""
+    if verify and not verify_spool(path, chunk_size):
+        raise ValueError(f"Spool checksum mismatch: {path}")
+
+    with open(path, "rb") as f:
+        header = _read_header(f)
+        for chunk in _iter_payload(f, header["length"], chunk_size):
+            printer._raw(chunk)
+    return header